@@ -4,10 +4,16 @@ A simple web app allowing users to draw one verse per email,
 with an admin interface for verse management.
 """
 
-from flask import Flask, render_template, request, jsonify, session
+from flask import Flask, Response, render_template, request, jsonify, session, stream_with_context
+from flask.json.provider import JSONProvider
 from flask_cors import CORS
+from decimal import Decimal
+from functools import wraps
+from itertools import islice
+import orjson
 import re
 import os
+from datetime import datetime
 from dotenv import load_dotenv
 
 # Load environment variables
@@ -16,8 +22,35 @@ load_dotenv()
 # Import database operations
 import database
 
+# ============== JSON ENCODING ==============
+
+def _orjson_default(obj):
+    """Encode the few types orjson does not handle natively."""
+    if isinstance(obj, Decimal):
+        return str(obj)
+    raise TypeError(f'Object of type {type(obj).__name__} is not JSON serializable')
+
+
+class OrjsonProvider(JSONProvider):
+    """JSON provider backed by orjson, used by jsonify() and request.get_json()."""
+
+    def dumps(self, obj, **kwargs):
+        return orjson.dumps(obj, default=_orjson_default).decode()
+
+    def loads(self, s, **kwargs):
+        return orjson.loads(s)
+
+    def response(self, *args, **kwargs):
+        obj = self._prepare_response_obj(args, kwargs)
+        # orjson already produces bytes; skip the str round-trip
+        return self._app.response_class(
+            orjson.dumps(obj, default=_orjson_default), mimetype='application/json'
+        )
+
+
 # Initialize Flask app
 app = Flask(__name__)
+app.json = OrjsonProvider(app)
 CORS(app)  # Enable CORS for API calls
 
 # Load secret key from environment (required in production)
@@ -32,10 +65,30 @@ database.init_db()
 
 # ============== EMAIL VALIDATION ==============
 
+# Email parts, compiled once at import; the address is split on '@' first
+# so obviously malformed input is rejected before any regex runs
+_LOCAL_RE = re.compile(r'[a-zA-Z0-9._%+-]+')
+_DOMAIN_RE = re.compile(r'[a-zA-Z0-9.-]+\.[a-zA-Z]{2,}')
+
+
 def is_valid_email(email):
     """Validate email format using regex."""
-    pattern = r'^[a-zA-Z0-9._%+-]+@[a-zA-Z0-9.-]+\.[a-zA-Z]{2,}$'
-    return re.match(pattern, email) is not None
+    if len(email) > 254 or email.count('@') != 1:
+        return False
+    local, domain = email.split('@')
+    return _LOCAL_RE.fullmatch(local) is not None and _DOMAIN_RE.fullmatch(domain) is not None
+
+
+# ============== ADMIN AUTH ==============
+
+def require_admin(f):
+    """Reject the request with 401 unless an admin is logged in."""
+    @wraps(f)
+    def wrapper(*args, **kwargs):
+        if session.get('admin_id') is None:
+            return jsonify({'success': False, 'error': 'Non autorisé'}), 401
+        return f(*args, **kwargs)
+    return wrapper
 
 
 # ============== PAGE ROUTES ==============
@@ -69,7 +122,8 @@ def draw_verse():
             'error': 'Email requis'
         }), 400
     
-    email = data['email'].strip()
+    # Normalize once here; the database layer expects a stripped, lowercased email
+    email = data['email'].strip().lower()
     
     # Validate email format
     if not is_valid_email(email):
@@ -115,8 +169,8 @@ def admin_login():
     admin_id = database.verify_admin(data['username'], data['password'])
     
     if admin_id:
+        # Keep the signed session cookie small: the admin id alone marks a login
         session['admin_id'] = admin_id
-        session['admin_logged_in'] = True
         return jsonify({
             'success': True,
             'message': 'Connexion réussie'
@@ -138,45 +192,97 @@ def admin_logout():
 @app.route('/api/admin/check', methods=['GET'])
 def admin_check():
     """Check if admin is logged in."""
-    is_logged_in = session.get('admin_logged_in', False)
-    return jsonify({'logged_in': is_logged_in})
+    is_logged_in = session.get('admin_id') is not None
+    resp = jsonify({'logged_in': is_logged_in})
+    # Short browser cache for repeated polls; private since it depends on the session cookie
+    resp.headers['Cache-Control'] = 'private, max-age=5'
+    return resp
+
+
+def _stream_verses_json(verses, total_draws, chunk_size=500):
+    """
+    Yield the verses payload as JSON a chunk of rows at a time, reading `verses`
+    lazily so neither the rows nor the body are ever held in memory at once.
+    Stats come last so total_verses counts the rows actually sent.
+    """
+    dumps = app.json.dumps
+    yield '{"success": true, "verses": ['
+    count = 0
+    while True:
+        chunk = [dumps(verse) for verse in islice(verses, chunk_size)]
+        if not chunk:
+            break
+        yield (', ' if count else '') + ', '.join(chunk)
+        count += len(chunk)
+    yield '], "stats": ' + dumps({'total_draws': total_draws, 'total_verses': count}) + '}'
+
+
+def _verses_etag(total_draws, total_verses, newest_id):
+    """ETag for the admin verses payload; verse ids only grow, so this changes with it."""
+    return f'{total_draws}-{total_verses}-{newest_id}'
 
 
 @app.route('/api/admin/verses', methods=['GET'])
+@require_admin
 def get_verses():
     """Get all verses (admin only)."""
-    if not session.get('admin_logged_in'):
-        return jsonify({'success': False, 'error': 'Non autorisé'}), 401
-    
-    verses = database.get_all_verses()
-    stats = database.get_draw_stats()
-    
-    return jsonify({
-        'success': True,
-        'verses': verses,
-        'stats': stats
-    })
+    # Answer revalidations from a single cheap query, before reading any verses.
+    # A write landing after this query only makes the body newer than its tag, so
+    # the next revalidation misses instead of serving a stale list.
+    total_draws, total_verses, newest_id = database.get_verses_version()
+    etag = _verses_etag(total_draws, total_verses, newest_id)
+    if request.if_none_match.contains(etag):
+        resp = app.response_class(status=304)
+    else:
+        body = _stream_verses_json(database.iter_all_verses(), total_draws)
+        resp = Response(stream_with_context(body), mimetype='application/json')
+    resp.set_etag(etag)
+    resp.headers['Cache-Control'] = 'private, no-cache'
+    return resp
 
 
 @app.route('/api/admin/draws', methods=['GET'])
+@require_admin
 def admin_draws():
-    """Get all user draws (admin only)."""
-    if not session.get('admin_logged_in'):
-        return jsonify({'success': False, 'error': 'Non autorisé'}), 401
+    """
+    Get user draws, newest first, one page at a time (admin only).
+    Optional query: ?limit=50&before=<drawn_at>&before_id=<id>
+    Returns: { "success": true, "draws": [...], "next": {"before": ..., "before_id": ...} | null }
+    """
+    limit = min(max(request.args.get('limit', 50, type=int), 1), 500)
+    before_id = request.args.get('before_id', type=int)
+    before = request.args.get('before')
+    if before:
+        try:
+            before = datetime.fromisoformat(before)
+        except ValueError:
+            return jsonify({'success': False, 'error': 'Paramètre before invalide'}), 400
+    else:
+        before = None
+
+    draws = database.get_all_draws(before=before, before_id=before_id, limit=limit)
+
+    # Cursor for the next page, taken from the last row of this one
+    next_page = None
+    if len(draws) == limit:
+        last = draws[-1]
+        drawn_at = last['drawn_at']
+        next_page = {
+            'before': drawn_at.isoformat() if isinstance(drawn_at, datetime) else drawn_at,
+            'before_id': last['id']
+        }
 
-    draws = database.get_all_draws()
     return jsonify({
         'success': True,
-        'draws': draws
+        'draws': draws,
+        'next': next_page
     })
 
 
 @app.route('/api/admin/verses', methods=['POST'])
+@require_admin
 def add_verse():
     """Add a new verse (admin only)."""
-    if not session.get('admin_logged_in'):
-        return jsonify({'success': False, 'error': 'Non autorisé'}), 401
-    
     data = request.get_json()
     
     if not data or 'text' not in data or 'reference' not in data:
@@ -204,11 +310,9 @@ def add_verse():
 
 
 @app.route('/api/admin/verses/<int:verse_id>', methods=['DELETE'])
+@require_admin
 def delete_verse(verse_id):
     """Delete a verse (admin only)."""
-    if not session.get('admin_logged_in'):
-        return jsonify({'success': False, 'error': 'Non autorisé'}), 401
-    
     deleted = database.delete_verse(verse_id)
     
     if deleted:
@@ -236,4 +340,5 @@ if __name__ == '__main__':
     print("   Default login: admin / admin123")
     print(f"Starting with DEBUG={debug_flag}")
     print("=" * 50)
-    app.run(debug=debug_flag, host='0.0.0.0', port=port)
+    # Development server only; production runs under gunicorn (see gunicorn.conf.py)
+    app.run(debug=debug_flag, host='0.0.0.0', port=port, threaded=True)
@@ -4,9 +4,12 @@ Supports both SQLite (local development) and PostgreSQL (production).
 """
 
 import os
+import random
+import threading
+import time
+from contextlib import contextmanager
 from werkzeug.security import generate_password_hash, check_password_hash
 from datetime import datetime
-import random
 
 # Check if we're using PostgreSQL (production) or SQLite (local dev)
 DATABASE_URL = os.environ.get('DATABASE_URL')
@@ -14,26 +17,73 @@ DATABASE_URL = os.environ.get('DATABASE_URL')
 if DATABASE_URL:
     # Production: Use PostgreSQL
     import psycopg2
+    import psycopg2.extensions
+    import psycopg2.pool
     from psycopg2.extras import RealDictCursor
     USE_POSTGRES = True
+
+    class _PooledConnection(psycopg2.extensions.connection):
+        """Connection that remembers whether the hot statements are PREPAREd on it."""
+        statements_prepared = False
+
+    # Shared pool so requests reuse connections instead of reconnecting. Each
+    # request thread holds at most one connection, so the pool is sized to the
+    # thread count (GUNICORN_THREADS, see gunicorn.conf.py). psycopg2 closes
+    # released connections beyond minconn, so minconn == maxconn keeps them all.
+    DB_POOL_SIZE = int(os.environ.get('DB_POOL_SIZE', os.environ.get('GUNICORN_THREADS', 8)))
+    _PG_POOL = psycopg2.pool.ThreadedConnectionPool(
+        minconn=DB_POOL_SIZE, maxconn=DB_POOL_SIZE, dsn=DATABASE_URL,
+        connection_factory=_PooledConnection
+    )
 else:
     # Local development: Use SQLite
     import sqlite3
     USE_POSTGRES = False
     DB_PATH = os.path.join(os.path.dirname(__file__), 'verset.db')
+    # One SQLite connection per thread, kept open between requests
+    _SQLITE_LOCAL = threading.local()
+
+# In-process copy of the verses table, used to pick the verse for a draw.
+# Verses change rarely (admin edits) but are read on every draw. Local writes
+# bump 'version' to invalidate it; the TTL bounds staleness when another worker
+# process edits the table, and a draw that picks a since-deleted verse inserts
+# nothing and retries with a fresh list.
+VERSE_CACHE_TTL = 60
+_VERSE_CACHE = {'version': 0, 'rows': None, 'loaded_at': 0.0}
+_CACHE_LOCK = threading.Lock()
+
+# username -> (admin_id, password_hash); the admin table is tiny and rarely changes
+_ADMIN_CACHE = {}
 
 
 def get_connection():
-    """Create and return a database connection."""
+    """Return a database connection (pooled on PostgreSQL, per-thread on SQLite)."""
     if USE_POSTGRES:
-        conn = psycopg2.connect(DATABASE_URL)
-        return conn
+        return _PG_POOL.getconn()
     else:
-        conn = sqlite3.connect(DB_PATH)
-        conn.row_factory = sqlite3.Row
+        conn = getattr(_SQLITE_LOCAL, 'conn', None)
+        if conn is None:
+            conn = sqlite3.connect(DB_PATH)
+            conn.row_factory = sqlite3.Row
+            # Per-connection tuning; runs once per thread since the connection is reused
+            conn.execute('PRAGMA synchronous=NORMAL')
+            conn.execute('PRAGMA temp_store=MEMORY')
+            conn.execute('PRAGMA mmap_size=268435456')
+            conn.execute('PRAGMA cache_size=-64000')
+            _SQLITE_LOCAL.conn = conn
         return conn
 
 
+def release_connection(conn):
+    """Give a connection obtained from get_connection() back for reuse."""
+    if USE_POSTGRES:
+        # Connections the server dropped are discarded instead of pooled
+        _PG_POOL.putconn(conn, close=bool(conn.closed))
+    elif conn.in_transaction:
+        # SQLite connections stay open on their thread; drop uncommitted work
+        conn.rollback()
+
+
 def get_cursor(conn):
     """Get a cursor with appropriate settings."""
     if USE_POSTGRES:
@@ -42,287 +92,413 @@ def get_cursor(conn):
         return conn.cursor()
 
 
+@contextmanager
+def db_cursor():
+    """Yield (cursor, conn); commit on success, roll back on error, always release."""
+    conn = get_connection()
+    try:
+        yield get_cursor(conn), conn
+        conn.commit()
+    except Exception:
+        # Rolling back a connection the server dropped would raise and mask the real error
+        if not (USE_POSTGRES and conn.closed):
+            conn.rollback()
+        raise
+    finally:
+        release_connection(conn)
+
+
+def as_dict(row):
+    """Return a row as a plain dict (RealDictCursor rows already are one)."""
+    if row is None or USE_POSTGRES:
+        return row
+    return dict(row)
+
+
+def as_dicts(rows):
+    """Return a list of rows as dicts, copying only when the driver requires it."""
+    if USE_POSTGRES:
+        return rows
+    return [dict(row) for row in rows]
+
+
 def placeholder():
     """Return the correct placeholder for SQL queries."""
     return "%s" if USE_POSTGRES else "?"
 
 
-def init_db():
-    """Initialize the database with required tables."""
-    conn = get_connection()
-    cursor = get_cursor(conn)
-    
-    # Create verses table
-    if USE_POSTGRES:
-        cursor.execute('''
-            CREATE TABLE IF NOT EXISTS verses (
-                id SERIAL PRIMARY KEY,
-                text TEXT NOT NULL,
-                reference TEXT NOT NULL,
-                created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP
-            )
-        ''')
-    else:
-        cursor.execute('''
-            CREATE TABLE IF NOT EXISTS verses (
-                id INTEGER PRIMARY KEY AUTOINCREMENT,
-                text TEXT NOT NULL,
-                reference TEXT NOT NULL,
-                created_at DATETIME DEFAULT CURRENT_TIMESTAMP
-            )
-        ''')
-    
-    # Create user_draws table
-    if USE_POSTGRES:
-        cursor.execute('''
-            CREATE TABLE IF NOT EXISTS user_draws (
-                id SERIAL PRIMARY KEY,
-                email TEXT UNIQUE NOT NULL,
-                verse_id INTEGER NOT NULL,
-                first_name TEXT,
-                last_name TEXT,
-                drawn_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
-                FOREIGN KEY (verse_id) REFERENCES verses(id)
-            )
-        ''')
-    else:
-        cursor.execute('''
-            CREATE TABLE IF NOT EXISTS user_draws (
-                id INTEGER PRIMARY KEY AUTOINCREMENT,
-                email TEXT UNIQUE NOT NULL,
-                verse_id INTEGER NOT NULL,
-                first_name TEXT,
-                last_name TEXT,
-                drawn_at DATETIME DEFAULT CURRENT_TIMESTAMP,
-                FOREIGN KEY (verse_id) REFERENCES verses(id)
-            )
-        ''')
-    
-    # Create admin table
+# ============== HOT STATEMENTS ==============
+# SQL for the per-draw queries, built once at import. SQLite caches compiled
+# statements per connection keyed by SQL text, so reusing the same string skips
+# re-parsing; on PostgreSQL they are PREPAREd once per pooled connection.
+
+_PG_PREPARE = {}
+
+
+def _hot_statement(name, sql, param_count):
+    """Return the SQL to run `sql` (written with {} placeholders) as a hot statement."""
     if USE_POSTGRES:
+        _PG_PREPARE[name] = sql.format(*(f'${i}' for i in range(1, param_count + 1)))
+        return f'EXECUTE {name} ({", ".join(["%s"] * param_count)})'
+    return sql.format(*(['?'] * param_count))
+
+
+def _prepare_hot_statements(cursor, conn):
+    """
+    PREPARE the hot statements on a PostgreSQL connection the first time it is used.
+    Pooled connections are kept for the life of the worker, so this runs once per connection.
+    """
+    if USE_POSTGRES and not conn.statements_prepared:
+        # All PREPAREs in one round-trip
+        cursor.execute(_PG_PREPARE_SQL)
+        conn.statements_prepared = True
+
+
+_CHECK_USER_DRAW_SQL = _hot_statement('check_user_draw_stmt', '''
+    SELECT v.id, v.text, v.reference, ud.drawn_at, ud.first_name, ud.last_name
+    FROM user_draws ud
+    JOIN verses v ON ud.verse_id = v.id
+    WHERE ud.email = {}
+''', 1)
+
+# The UNIQUE email constraint turns a repeat (or concurrent) draw into a no-op,
+# and selecting the verse id from verses inserts nothing if it has been deleted
+_INSERT_DRAW_SQL = _hot_statement('insert_draw_stmt', (
+    'INSERT INTO user_draws (email, verse_id, first_name, last_name) '
+    'SELECT {}, id, {}, {} FROM verses WHERE id = {} '
+    'ON CONFLICT (email) DO NOTHING'
+    if USE_POSTGRES else
+    'INSERT OR IGNORE INTO user_draws (email, verse_id, first_name, last_name) '
+    'SELECT {}, id, {}, {} FROM verses WHERE id = {}'
+), 4)
+
+
+_PG_PREPARE_SQL = '; '.join(f'PREPARE {name} AS {sql}' for name, sql in _PG_PREPARE.items())
+
+
+# ============== SCHEMA ==============
+# Whole schema as one script per backend, so startup creates it in one round-trip
+
+_PG_SCHEMA_SQL = '''
+    CREATE TABLE IF NOT EXISTS verses (
+        id SERIAL PRIMARY KEY,
+        text TEXT NOT NULL,
+        reference TEXT NOT NULL,
+        created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP
+    );
+    CREATE TABLE IF NOT EXISTS user_draws (
+        id SERIAL PRIMARY KEY,
+        email TEXT UNIQUE NOT NULL,
+        verse_id INTEGER NOT NULL,
+        first_name TEXT,
+        last_name TEXT,
+        drawn_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
+        FOREIGN KEY (verse_id) REFERENCES verses(id)
+    );
+    CREATE TABLE IF NOT EXISTS admin (
+        id SERIAL PRIMARY KEY,
+        username TEXT UNIQUE NOT NULL,
+        password_hash TEXT NOT NULL
+    );
+    CREATE INDEX IF NOT EXISTS idx_user_draws_verse_id ON user_draws(verse_id);
+    DROP INDEX IF EXISTS idx_user_draws_drawn_at;
+    CREATE INDEX IF NOT EXISTS idx_user_draws_drawn_at_id ON user_draws(drawn_at DESC, id DESC);
+'''
+
+# WAL is stored in the database file, so setting it here once is enough;
+# readers then no longer block on a writer
+_SQLITE_SCHEMA_SQL = '''
+    PRAGMA journal_mode=WAL;
+    CREATE TABLE IF NOT EXISTS verses (
+        id INTEGER PRIMARY KEY AUTOINCREMENT,
+        text TEXT NOT NULL,
+        reference TEXT NOT NULL,
+        created_at DATETIME DEFAULT CURRENT_TIMESTAMP
+    );
+    CREATE TABLE IF NOT EXISTS user_draws (
+        id INTEGER PRIMARY KEY AUTOINCREMENT,
+        email TEXT UNIQUE NOT NULL,
+        verse_id INTEGER NOT NULL,
+        first_name TEXT,
+        last_name TEXT,
+        drawn_at DATETIME DEFAULT CURRENT_TIMESTAMP,
+        FOREIGN KEY (verse_id) REFERENCES verses(id)
+    );
+    CREATE TABLE IF NOT EXISTS admin (
+        id INTEGER PRIMARY KEY AUTOINCREMENT,
+        username TEXT UNIQUE NOT NULL,
+        password_hash TEXT NOT NULL
+    );
+    CREATE INDEX IF NOT EXISTS idx_user_draws_verse_id ON user_draws(verse_id);
+    DROP INDEX IF EXISTS idx_user_draws_drawn_at;
+    CREATE INDEX IF NOT EXISTS idx_user_draws_drawn_at_id ON user_draws(drawn_at DESC, id DESC);
+'''
+
+# Arbitrary key for the PostgreSQL advisory lock held while init_db() runs
+_INIT_DB_LOCK_ID = 731104
+
+SAMPLE_VERSES = [
+    ("Car Dieu a tant aimé le monde qu'il a donné son Fils unique, afin que quiconque croit en lui ne périsse point, mais qu'il ait la vie éternelle.", "Jean 3:16"),
+    ("L'Éternel est mon berger: je ne manquerai de rien.", "Psaume 23:1"),
+    ("Je puis tout par celui qui me fortifie.", "Philippiens 4:13"),
+    ("Confie-toi en l'Éternel de tout ton cœur, Et ne t'appuie pas sur ta sagesse.", "Proverbes 3:5"),
+    ("Car je connais les projets que j'ai formés sur vous, dit l'Éternel, projets de paix et non de malheur, afin de vous donner un avenir et de l'espérance.", "Jérémie 29:11"),
+    ("Ne crains point, car je suis avec toi; Ne promène pas des regards inquiets, car je suis ton Dieu.", "Ésaïe 41:10"),
+    ("Venez à moi, vous tous qui êtes fatigués et chargés, et je vous donnerai du repos.", "Matthieu 11:28"),
+    ("L'amour est patient, il est plein de bonté; l'amour n'est point envieux; l'amour ne se vante point.", "1 Corinthiens 13:4"),
+]
+
+
+def init_db():
+    """
+    Initialize the database with required tables.
+    Safe to run concurrently: every gunicorn worker calls it while booting.
+    """
+    with db_cursor() as (cursor, conn):
+        # Create tables and indexes
+        if USE_POSTGRES:
+            # Serialize concurrent runs; the lock is released when this transaction ends
+            cursor.execute('SELECT pg_advisory_xact_lock(%s)', (_INIT_DB_LOCK_ID,))
+            cursor.execute(_PG_SCHEMA_SQL)
+        else:
+            conn.executescript(_SQLITE_SCHEMA_SQL)
+        
+        p = placeholder()
         cursor.execute('''
-            CREATE TABLE IF NOT EXISTS admin (
-                id SERIAL PRIMARY KEY,
-                username TEXT UNIQUE NOT NULL,
-                password_hash TEXT NOT NULL
-            )
-        ''')
-    else:
-        cursor.execute('''
-            CREATE TABLE IF NOT EXISTS admin (
-                id INTEGER PRIMARY KEY AUTOINCREMENT,
-                username TEXT UNIQUE NOT NULL,
-                password_hash TEXT NOT NULL
-            )
+            SELECT (SELECT COUNT(*) FROM admin) AS admin_count,
+                   (SELECT COUNT(*) FROM verses) AS verse_count
         ''')
+        counts = cursor.fetchone()
+        
+        # Insert default admin if not exists; another worker may have just
+        # inserted it, so a duplicate username is ignored
+        if counts['admin_count'] == 0:
+            password_hash = generate_password_hash('admin123')
+            if USE_POSTGRES:
+                cursor.execute(
+                    f'INSERT INTO admin (username, password_hash) VALUES ({p}, {p}) '
+                    'ON CONFLICT (username) DO NOTHING',
+                    ('admin', password_hash)
+                )
+            else:
+                cursor.execute(
+                    f'INSERT OR IGNORE INTO admin (username, password_hash) VALUES ({p}, {p})',
+                    ('admin', password_hash)
+                )
+        
+        # Insert sample verses if none exist, as a single multi-row INSERT;
+        # the NOT EXISTS guard is checked again under the write lock
+        if counts['verse_count'] == 0:
+            values = ', '.join([f'({p}, {p})'] * len(SAMPLE_VERSES))
+            params = [value for verse in SAMPLE_VERSES for value in verse]
+            cursor.execute(f'''
+                INSERT INTO verses (text, reference)
+                SELECT * FROM (VALUES {values}) AS seed
+                WHERE NOT EXISTS (SELECT 1 FROM verses)
+            ''', params)
     
-    conn.commit()
-    
-    # Insert default admin if not exists
-    p = placeholder()
-    cursor.execute('SELECT COUNT(*) as count FROM admin')
-    row = cursor.fetchone()
-    count = row['count'] if USE_POSTGRES else row[0]
-    
-    if count == 0:
-        password_hash = generate_password_hash('admin123')
-        cursor.execute(
-            f'INSERT INTO admin (username, password_hash) VALUES ({p}, {p})',
-            ('admin', password_hash)
-        )
-    
-    # Insert sample verses if none exist
-    cursor.execute('SELECT COUNT(*) as count FROM verses')
-    row = cursor.fetchone()
-    count = row['count'] if USE_POSTGRES else row[0]
-    
-    if count == 0:
-        sample_verses = [
-            ("Car Dieu a tant aimé le monde qu'il a donné son Fils unique, afin que quiconque croit en lui ne périsse point, mais qu'il ait la vie éternelle.", "Jean 3:16"),
-            ("L'Éternel est mon berger: je ne manquerai de rien.", "Psaume 23:1"),
-            ("Je puis tout par celui qui me fortifie.", "Philippiens 4:13"),
-            ("Confie-toi en l'Éternel de tout ton cœur, Et ne t'appuie pas sur ta sagesse.", "Proverbes 3:5"),
-            ("Car je connais les projets que j'ai formés sur vous, dit l'Éternel, projets de paix et non de malheur, afin de vous donner un avenir et de l'espérance.", "Jérémie 29:11"),
-            ("Ne crains point, car je suis avec toi; Ne promène pas des regards inquiets, car je suis ton Dieu.", "Ésaïe 41:10"),
-            ("Venez à moi, vous tous qui êtes fatigués et chargés, et je vous donnerai du repos.", "Matthieu 11:28"),
-            ("L'amour est patient, il est plein de bonté; l'amour n'est point envieux; l'amour ne se vante point.", "1 Corinthiens 13:4"),
-        ]
-        for text, reference in sample_verses:
-            cursor.execute(
-                f'INSERT INTO verses (text, reference) VALUES ({p}, {p})',
-                (text, reference)
-            )
-    
-    conn.commit()
-    conn.close()
+    refresh_admin_cache()
 
 
 # ============== VERSE OPERATIONS ==============
 
-def get_all_verses():
-    """Get all verses from the database."""
-    conn = get_connection()
-    cursor = get_cursor(conn)
-    cursor.execute('SELECT id, text, reference, created_at FROM verses ORDER BY id DESC')
-    verses = [dict(row) for row in cursor.fetchall()]
-    conn.close()
-    return verses
+def _get_verses_cached():
+    """Return the cached verse rows, reloading them if invalidated or expired."""
+    with _CACHE_LOCK:
+        version = _VERSE_CACHE['version']
+        rows = _VERSE_CACHE['rows']
+        if rows is not None and time.monotonic() - _VERSE_CACHE['loaded_at'] < VERSE_CACHE_TTL:
+            return rows
+    
+    with db_cursor() as (cursor, conn):
+        cursor.execute('SELECT id, text, reference, created_at FROM verses ORDER BY id DESC')
+        rows = as_dicts(cursor.fetchall())
+    
+    with _CACHE_LOCK:
+        # Don't store rows read before a concurrent invalidation
+        if _VERSE_CACHE['version'] == version:
+            _VERSE_CACHE['rows'] = rows
+            _VERSE_CACHE['loaded_at'] = time.monotonic()
+    return rows
+
+
+def _invalidate_verse_cache():
+    """Drop the cached verse rows after the verses table changed."""
+    with _CACHE_LOCK:
+        _VERSE_CACHE['version'] += 1
+        _VERSE_CACHE['rows'] = None
+
+
+def iter_all_verses(chunk_size=500):
+    """
+    Yield all verses from the database, newest first, without loading the whole table.
+    The connection is held until the generator is exhausted or closed.
+    """
+    with db_cursor() as (cursor, conn):
+        if USE_POSTGRES:
+            # Server-side cursor: rows are fetched chunk_size at a time
+            cursor = conn.cursor('verses_stream', cursor_factory=RealDictCursor)
+            cursor.itersize = chunk_size
+        cursor.execute('SELECT id, text, reference, created_at FROM verses ORDER BY id DESC')
+        for row in cursor:
+            yield as_dict(row)
 
 
 def add_verse(text, reference):
     """Add a new verse to the database."""
-    conn = get_connection()
-    cursor = get_cursor(conn)
-    p = placeholder()
-    
-    if USE_POSTGRES:
-        cursor.execute(
-            f'INSERT INTO verses (text, reference) VALUES ({p}, {p}) RETURNING id',
-            (text, reference)
-        )
-        verse_id = cursor.fetchone()['id']
-    else:
-        cursor.execute(
-            f'INSERT INTO verses (text, reference) VALUES ({p}, {p})',
-            (text, reference)
-        )
-        verse_id = cursor.lastrowid
+    with db_cursor() as (cursor, conn):
+        p = placeholder()
     
-    conn.commit()
-    conn.close()
+        if USE_POSTGRES:
+            cursor.execute(
+                f'INSERT INTO verses (text, reference) VALUES ({p}, {p}) RETURNING id',
+                (text, reference)
+            )
+            verse_id = cursor.fetchone()['id']
+        else:
+            cursor.execute(
+                f'INSERT INTO verses (text, reference) VALUES ({p}, {p})',
+                (text, reference)
+            )
+            verse_id = cursor.lastrowid
+    _invalidate_verse_cache()
     return verse_id
 
 
 def delete_verse(verse_id):
     """Delete a verse by its ID."""
-    conn = get_connection()
-    cursor = get_cursor(conn)
-    p = placeholder()
-    cursor.execute(f'DELETE FROM verses WHERE id = {p}', (verse_id,))
-    deleted = cursor.rowcount > 0
-    conn.commit()
-    conn.close()
+    with db_cursor() as (cursor, conn):
+        p = placeholder()
+        cursor.execute(f'DELETE FROM verses WHERE id = {p}', (verse_id,))
+        deleted = cursor.rowcount > 0
+    if deleted:
+        _invalidate_verse_cache()
     return deleted
 
 
 def get_verse_by_id(verse_id):
     """Get a specific verse by ID."""
-    conn = get_connection()
-    cursor = get_cursor(conn)
-    p = placeholder()
-    cursor.execute(f'SELECT id, text, reference FROM verses WHERE id = {p}', (verse_id,))
-    row = cursor.fetchone()
-    conn.close()
-    return dict(row) if row else None
+    with db_cursor() as (cursor, conn):
+        p = placeholder()
+        cursor.execute(f'SELECT id, text, reference FROM verses WHERE id = {p}', (verse_id,))
+        row = cursor.fetchone()
+    return as_dict(row)
 
 
 # ============== USER DRAW OPERATIONS ==============
 
-def check_user_draw(email):
-    """Check if a user has already drawn a verse."""
-    conn = get_connection()
-    cursor = get_cursor(conn)
-    p = placeholder()
-    cursor.execute(f'''
-        SELECT v.id, v.text, v.reference, ud.drawn_at, ud.first_name, ud.last_name
-        FROM user_draws ud
-        JOIN verses v ON ud.verse_id = v.id
-        WHERE ud.email = {p}
-    ''', (email.lower(),))
-    row = cursor.fetchone()
-    conn.close()
-    return dict(row) if row else None
+def check_user_draw(cursor, email):
+    """
+    Return the verse a user already drew, or None (email already normalized).
+    Runs on the caller's cursor, which must have had _prepare_hot_statements() applied.
+    """
+    cursor.execute(_CHECK_USER_DRAW_SQL, (email,))
+    return as_dict(cursor.fetchone())
 
 
 def draw_verse_for_user(email, first_name=None, last_name=None):
-    """Draw a random verse for a user."""
-    email = email.lower().strip()
-    
-    # Check if user already drew
-    existing = check_user_draw(email)
-    if existing:
-        return {
-            'verse': existing,
-            'already_drawn': True
-        }
-    
-    # Get all available verses
-    conn = get_connection()
-    cursor = get_cursor(conn)
-    cursor.execute('SELECT id, text, reference FROM verses')
-    verses = cursor.fetchall()
-    
-    if not verses:
-        conn.close()
-        return None
-    
-    # Pick a random verse
-    chosen = random.choice(verses)
-    chosen_dict = dict(chosen)
-    
-    # Save the draw
-    p = placeholder()
-    cursor.execute(
-        f'INSERT INTO user_draws (email, verse_id, first_name, last_name) VALUES ({p}, {p}, {p}, {p})',
-        (email, chosen_dict['id'], first_name, last_name)
-    )
-    conn.commit()
-    conn.close()
-    
-    return {
-        'verse': chosen_dict,
-        'already_drawn': False
-    }
+    """Draw a random verse for a user (email already stripped and lowercased)."""
+    # Second pass only runs if the cached verse list turned out to be stale
+    for _ in range(2):
+        # Pick from the cached verse list so a first-time draw is a single INSERT
+        verses = _get_verses_cached()
+        
+        with db_cursor() as (cursor, conn):
+            _prepare_hot_statements(cursor, conn)
+            if verses:
+                chosen = random.choice(verses)
+                cursor.execute(_INSERT_DRAW_SQL, (email, first_name, last_name, chosen['id']))
+                if cursor.rowcount > 0:
+                    return {
+                        'verse': {'id': chosen['id'], 'text': chosen['text'], 'reference': chosen['reference']},
+                        'already_drawn': False
+                    }
+            
+            # Nothing was inserted: either the user already drew or there are no
+            # verses. Look the draw up on the same connection.
+            existing = check_user_draw(cursor, email)
+        
+        if existing:
+            return {
+                'verse': existing,
+                'already_drawn': True
+            }
+        
+        # No draw and nothing inserted: the chosen verse was deleted by another
+        # worker (or the cache was empty), so reload the list and try again
+        _invalidate_verse_cache()
+    return None
 
 
 # ============== ADMIN OPERATIONS ==============
 
+def refresh_admin_cache():
+    """Reload admin credentials into memory; call after changing the admin table."""
+    global _ADMIN_CACHE
+    with db_cursor() as (cursor, conn):
+        cursor.execute('SELECT id, username, password_hash FROM admin')
+        rows = cursor.fetchall()
+    # Swap in a new dict so concurrent logins never see a half-filled cache
+    _ADMIN_CACHE = {row['username']: (row['id'], row['password_hash']) for row in rows}
+
+
 def verify_admin(username, password):
     """Verify admin credentials."""
-    conn = get_connection()
-    cursor = get_cursor(conn)
-    p = placeholder()
-    cursor.execute(
-        f'SELECT id, password_hash FROM admin WHERE username = {p}',
-        (username,)
-    )
-    row = cursor.fetchone()
-    conn.close()
+    cached = _ADMIN_CACHE.get(username)
     
-    if row:
-        row_dict = dict(row)
-        if check_password_hash(row_dict['password_hash'], password):
-            return row_dict['id']
+    # The hash check stays on every attempt; only the lookup is cached
+    if cached:
+        admin_id, password_hash = cached
+        if check_password_hash(password_hash, password):
+            return admin_id
     return None
 
 
-def get_draw_stats():
-    """Get statistics about draws."""
-    conn = get_connection()
-    cursor = get_cursor(conn)
-    cursor.execute('SELECT COUNT(*) as total FROM user_draws')
-    row = cursor.fetchone()
-    total_draws = dict(row)['total'] if USE_POSTGRES else row[0]
-    cursor.execute('SELECT COUNT(*) as total FROM verses')
-    row = cursor.fetchone()
-    total_verses = dict(row)['total'] if USE_POSTGRES else row[0]
-    conn.close()
-    return {
-        'total_draws': total_draws,
-        'total_verses': total_verses
-    }
-
-
-def get_all_draws():
-    """Return all draws with email, verse id, drawn_at and verse reference/text."""
-    conn = get_connection()
-    cursor = get_cursor(conn)
-    cursor.execute('''
-        SELECT ud.email, ud.verse_id, ud.drawn_at, ud.first_name, ud.last_name, v.text, v.reference
-        FROM user_draws ud
-        JOIN verses v ON ud.verse_id = v.id
-        ORDER BY ud.drawn_at DESC
-    ''')
-    draws = [dict(row) for row in cursor.fetchall()]
-    conn.close()
+def get_verses_version():
+    """
+    Return (total_draws, total_verses, newest_verse_id) in one query.
+    Verse ids only grow, so this changes whenever the admin verses payload does.
+    """
+    with db_cursor() as (cursor, conn):
+        cursor.execute('''
+            SELECT (SELECT COUNT(*) FROM user_draws) AS total_draws,
+                   (SELECT COUNT(*) FROM verses) AS total_verses,
+                   (SELECT COALESCE(MAX(id), 0) FROM verses) AS newest_verse_id
+        ''')
+        row = cursor.fetchone()
+    return row['total_draws'], row['total_verses'], row['newest_verse_id']
+
+
+def get_all_draws(before=None, before_id=None, limit=50):
+    """Return a page of draws (newest first) with email, verse id, drawn_at and verse reference/text.
+
+    Pass the drawn_at/id of the last row of the previous page as before/before_id
+    to get the next page; ties on drawn_at are broken by id.
+    """
+    p = placeholder()
+    where = ''
+    params = []
+    if before is not None:
+        if not USE_POSTGRES:
+            # SQLite stores CURRENT_TIMESTAMP as 'YYYY-MM-DD HH:MM:SS' text
+            before = before.isoformat(sep=' ')
+        if before_id is not None:
+            # Row-value comparison, so the index is searched as a range
+            where = f'WHERE (ud.drawn_at, ud.id) < ({p}, {p})'
+            params = [before, before_id]
+        else:
+            where = f'WHERE ud.drawn_at < {p}'
+            params = [before]
+    params.append(limit)
+    
+    with db_cursor() as (cursor, conn):
+        cursor.execute(f'''
+            SELECT ud.id, ud.email, ud.verse_id, ud.drawn_at, ud.first_name, ud.last_name, v.text, v.reference
+            FROM user_draws ud
+            JOIN verses v ON ud.verse_id = v.id
+            {where}
+            ORDER BY ud.drawn_at DESC, ud.id DESC
+            LIMIT {p}
+        ''', params)
+        draws = as_dicts(cursor.fetchall())
     return draws
@@ -0,0 +1,18 @@
+"""
+Gunicorn settings for production.
+Loaded automatically by `gunicorn app:app` when started from this directory.
+"""
+
+import multiprocessing
+import os
+
+# One process per CPU, each serving requests from a pool of threads; the
+# endpoints are database-bound, so threads overlap the waiting time
+workers = int(os.environ.get('WEB_CONCURRENCY', multiprocessing.cpu_count()))
+# database.py sizes its PostgreSQL pool from the same variable
+threads = int(os.environ.get('GUNICORN_THREADS', 8))
+worker_class = 'gthread'
+
+# Worker heartbeat files in RAM avoid stalls on slow or overlay disks
+if os.path.isdir('/dev/shm'):
+    worker_tmp_dir = '/dev/shm'
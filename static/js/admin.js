@@ -22,6 +22,8 @@ const drawsList = document.getElementById('draws-list');
 
 // ============== STATE ==============
 let isLoggedIn = false;
+let loadedDraws = [];
+let nextDrawsPage = null;
 
 // ============== UI HELPERS ==============
 /**
@@ -173,19 +175,30 @@ async function loadVerses() {
 }
 
 /**
- * Load all draws (emails) for admin
+ * Load draws (emails) for admin, one page at a time
+ * @param {boolean} append - Load the next page and add it to the list
  */
-async function loadDraws() {
+async function loadDraws(append = false) {
     if (!drawsList) return;
     try {
-        const response = await fetch('/api/admin/draws', { credentials: 'include' });
+        let url = '/api/admin/draws';
+        if (append && nextDrawsPage) {
+            const params = new URLSearchParams({
+                before: nextDrawsPage.before,
+                before_id: nextDrawsPage.before_id
+            });
+            url += `?${params}`;
+        }
+        const response = await fetch(url, { credentials: 'include' });
         if (response.status === 401) {
             showLogin();
             return;
         }
         const data = await response.json();
         if (data.success) {
-            renderDrawsList(data.draws);
+            loadedDraws = append ? loadedDraws.concat(data.draws) : data.draws;
+            nextDrawsPage = data.next;
+            renderDrawsList(loadedDraws);
         } else {
             drawsList.innerHTML = '<p class="empty-text">Erreur de chargement des tirages</p>';
         }
@@ -231,7 +244,13 @@ function renderDrawsList(draws) {
             </tbody>
         </table>
         </div>
+        ${nextDrawsPage ? '<button id="load-more-draws" class="btn btn-outline">Charger plus</button>' : ''}
     `;
+
+    const loadMoreBtn = document.getElementById('load-more-draws');
+    if (loadMoreBtn) {
+        loadMoreBtn.addEventListener('click', () => loadDraws(true));
+    }
 }
 
 /**